@@ -3,9 +3,11 @@
 """
 Estimate token counts for randomly generated lorem ipsum text across OpenAI and Anthropic models.
 
-- Uses tiktoken for OpenAI tokenization.
+- Uses tiktoken for OpenAI tokenization. By default counts are summed from per-word
+  token lengths (exact for the lorem corpus); --exact encodes every text instead.
+- Samples lorem words with NumPy when installed; otherwise uses the random module.
 - Uses Anthropic Messages Count Tokens API via the official Python SDK when an API key is
-  available; otherwise falls back to an approximation using cl100k_base.
+  available; otherwise falls back to a ~4 chars/token approximation.
 
 Run examples:
   python scripts/token_estimation.py --sizes 256 512 1024 --trials 5 \
@@ -16,14 +18,28 @@ Run examples:
 """
 
 import argparse
+import asyncio
+import contextlib
 import os
 import csv
+import functools
 import math
 import random
 import statistics
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
+from operator import attrgetter
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 try:
     import tiktoken  # type: ignore
@@ -36,12 +52,20 @@ except Exception:  # pragma: no cover
 
 
 # Optional Anthropic SDK import (for live token counting via API). If not available,
-# we'll approximate using tiktoken's cl100k_base.
+# we'll approximate at ~4 chars per token.
 try:  # pragma: no cover - environment dependent
     import anthropic  # type: ignore
+    import httpx  # type: ignore
 except Exception:  # pragma: no cover - environment dependent
     anthropic = None  # type: ignore
 
+# Optional NumPy import (vectorized word sampling). If not available, we'll sample with
+# the standard library's random module.
+try:  # pragma: no cover - environment dependent
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - environment dependent
+    np = None  # type: ignore
+
 
 LOREM_WORDS: Tuple[str, ...] = (
     "lorem",
@@ -116,7 +140,11 @@ LOREM_WORDS: Tuple[str, ...] = (
 )
 
 
-@dataclass
+# Provider label for Anthropic rows estimated without the Count Tokens API
+ANTHROPIC_APPROX_PROVIDER = "anthropic (approx)"
+
+
+@dataclass(slots=True, frozen=True)
 class SampleStats:
     size_label: str
     model: str
@@ -129,18 +157,47 @@ class SampleStats:
     mean_tokens_per_1k_chars: float
 
 
-def generate_lorem_text_by_chars(target_chars: int, rng: random.Random) -> str:
-    words: List[str] = []
-    # Keep appending words until at or above the target character length
-    while True:
-        word = rng.choice(LOREM_WORDS)
-        words.append(word)
-        # Add a space between words except the last; compute length with spaces
+# Mean word length including the joining space, used to size word draws up front.
+_MEAN_WLEN = statistics.fmean(len(w) for w in LOREM_WORDS) + 1
+
+_WORDS_NP = np.array(LOREM_WORDS) if np is not None else None
+
+# Word-sampling RNG: a NumPy Generator when NumPy is installed, else random.Random
+Rng = Union[random.Random, "np.random.Generator"]
+
+
+def make_rng(seed: int) -> Rng:
+    """Return a NumPy Generator when NumPy is installed, else a random.Random."""
+    if np is not None:
+        return np.random.default_rng(seed)
+    return random.Random(seed)
+
+
+def _draw_words(rng: Rng, k: int) -> List[str]:
+    if isinstance(rng, random.Random):
+        return rng.choices(LOREM_WORDS, k=k)
+    return rng.choice(_WORDS_NP, size=k, replace=True).tolist()
+
+
+def generate_lorem_text_by_chars(target_chars: int, rng: Rng) -> Tuple[str, List[str]]:
+    """Return the text and the words it is made of (the last one possibly truncated)."""
+    # Draw enough words in one batch to (almost always) cover the target length
+    k = max(1, int(target_chars / _MEAN_WLEN) + 8)
+    words = _draw_words(rng, k)
+    text = " ".join(words)
+    while len(text) < target_chars:
+        words.extend(_draw_words(rng, k))
         text = " ".join(words)
-        if len(text) >= target_chars:
-            return text[:target_chars]
+    text = text[:target_chars]
+    return text, text.split(" ")
+
+
+@functools.lru_cache(maxsize=None)
+def _cl100k():
+    return tiktoken.get_encoding("cl100k_base")
 
 
+@functools.lru_cache(maxsize=None)
 def get_openai_encoder_for_model(model: str):
     # Try model-specific encoding; fallback to sensible bases
     try:
@@ -150,45 +207,163 @@ def get_openai_encoder_for_model(model: str):
         try:
             return tiktoken.get_encoding("o200k_base")
         except Exception:
-            return tiktoken.get_encoding("cl100k_base")
+            return _cl100k()
 
 
 def count_tokens_openai(model: str, text: str) -> int:
     enc = get_openai_encoder_for_model(model)
-    return len(enc.encode(text))
+    return len(enc.encode_ordinary(text))
 
 
-def get_anthropic_counter(api_key: Optional[str]) -> Callable[[str, str], int]:
-    """Return a function that counts tokens for Anthropic.
+# Per-process caches used by count_tokens_batch. Under --exact they live in each
+# pool worker, so reuse only spans the jobs that one worker happens to run.
 
-    If the Anthropic SDK and an API key are available, use the live Count Tokens API.
-    Otherwise, fall back to an approximation using cl100k_base.
+# Token counts keyed by encoder name, then text; repeated texts skip encoding.
+_TOKEN_COUNT_CACHE: Dict[str, Dict[str, int]] = {}
+
+# Token counts keyed by encoder name, then chunk. Texts are encoded as ~512-char
+# chunks so a chunk repeated within a worker's jobs is only encoded once.
+_CHUNK_COUNT_CACHE: Dict[str, Dict[str, int]] = {}
+_CHUNK_CHARS = 512
+
+
+def _split_on_delim(text: str, delim: str, step: int) -> List[str]:
+    """Split text into pieces of roughly `step` chars, cutting just before a delimiter.
+
+    Each piece after the first starts with the delimiter, so for single-spaced text
+    the " word" pre-tokens BPE sees are preserved and the summed count stays exact.
+    """
+    parts: List[str] = []
+    start = 0
+    while start < len(text):
+        cut = text.find(delim, start + step)
+        if cut == -1:
+            parts.append(text[start:])
+            break
+        parts.append(text[start:cut])
+        start = cut
+    return parts
+
+
+def count_tokens_batch(enc, texts: List[str], num_threads: int) -> List[int]:
+    cache = _TOKEN_COUNT_CACHE.setdefault(enc.name, {})
+    chunk_cache = _CHUNK_COUNT_CACHE.setdefault(enc.name, {})
+    misses = list({t: None for t in texts if t not in cache})
+    chunked = [_split_on_delim(t, " ", _CHUNK_CHARS) for t in misses]
+    # All uncached chunks of all texts go through one batch, which tiktoken encodes
+    # in parallel; this also covers splitting long texts across threads. The corpus
+    # has no special-token markers, so the ordinary (no special-token scan) path is
+    # equivalent and cheaper.
+    new_chunks = list(
+        {c: None for chunks in chunked for c in chunks if c not in chunk_cache}
+    )
+    if new_chunks:
+        encoded = enc.encode_ordinary_batch(new_chunks, num_threads=num_threads)
+        for chunk, tokens in zip(new_chunks, encoded):
+            chunk_cache[chunk] = len(tokens)
+    for text, chunks in zip(misses, chunked):
+        cache[text] = sum(chunk_cache[c] for c in chunks)
+    return [cache[t] for t in texts]
+
+
+# Token lengths of single words keyed by encoder name, then word as it appears in the
+# text: bare for the first word, space-prefixed after that. Seeded with LOREM_WORDS;
+# truncated trailing words are added on first use.
+_WORD_TOKENS: Dict[str, Dict[str, int]] = {}
+
+
+def _word_token_table(enc) -> Dict[str, int]:
+    table = _WORD_TOKENS.get(enc.name)
+    if table is None:
+        table = {}
+        for w in LOREM_WORDS:
+            table[w] = len(enc.encode_ordinary(w))
+            table[" " + w] = len(enc.encode_ordinary(" " + w))
+        _WORD_TOKENS[enc.name] = table
+    return table
+
+
+def estimate_tokens_by_words(enc, word_lists: List[List[str]]) -> List[int]:
+    """Estimate token counts by summing per-word token lengths.
+
+    BPE pre-tokenization splits single-spaced lorem text at word boundaries, so this
+    matches a full encode without running the tokenizer over the text.
     """
-    env_key = os.environ.get("ANTHROPIC_API_KEY")
-    effective_key = api_key or env_key
+    table = _word_token_table(enc)
+    counts: List[int] = []
+    for words in word_lists:
+        keys = [words[0], *(" " + w for w in words[1:])]
+        for key in keys:
+            if key not in table:
+                table[key] = len(enc.encode_ordinary(key))
+        counts.append(sum(table[key] for key in keys))
+    return counts
+
+
+def _anthropic_live_key(api_key: Optional[str]) -> Optional[str]:
+    """Return the key to use for live Anthropic counts, or None to approximate."""
+    effective_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
     if anthropic is not None and effective_key:
-        client = anthropic.Anthropic(api_key=effective_key)
+        return effective_key
+    return None
 
-        approx_enc = tiktoken.get_encoding("cl100k_base")
 
-        def _count_live(model: str, text: str) -> int:
+@contextlib.asynccontextmanager
+async def get_anthropic_counter(
+    api_key: Optional[str],
+) -> AsyncIterator[Callable[[str, str], Awaitable[Tuple[int, bool]]]]:
+    """Yield an async function returning (token count, whether it was approximated).
+
+    If the Anthropic SDK and an API key are available, use the live Count Tokens API.
+    Otherwise, fall back to a ~4 chars/token approximation. Individual live calls that
+    fail are approximated with cl100k_base, except authentication and permission
+    errors, which propagate since every other call would fail the same way.
+    """
+    effective_key = _anthropic_live_key(api_key)
+    if effective_key:
+        # One pooled client shared by all concurrent count calls: HTTP/2 multiplexing
+        # plus keep-alive avoids a TLS handshake per request.
+        http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=30.0,
+        )
+        client = anthropic.AsyncAnthropic(
+            api_key=effective_key, http_client=http_client
+        )
+        # Bound in-flight requests so large runs don't trip rate limits
+        semaphore = asyncio.Semaphore(16)
+
+        approx_enc = _cl100k()
+
+        async def _count_live(model: str, text: str) -> Tuple[int, bool]:
             try:
-                resp = client.messages.count_tokens(
-                    model=model,
-                    messages=[{"role": "user", "content": text}],
-                )
-                return int(resp.input_tokens)  # type: ignore[attr-defined]
+                async with semaphore:
+                    resp = await client.messages.count_tokens(
+                        model=model,
+                        messages=[{"role": "user", "content": text}],
+                    )
+                return int(resp.input_tokens), False  # type: ignore[attr-defined]
+            except (anthropic.AuthenticationError, anthropic.PermissionDeniedError):
+                raise
             except Exception:
-                return len(approx_enc.encode(text))
+                return len(approx_enc.encode_ordinary(text)), True
 
-        return _count_live
+        try:
+            yield _count_live
+        finally:
+            await client.close()
+        return
 
-    approx_enc = tiktoken.get_encoding("cl100k_base")
+    async def _count_approx(model: str, text: str) -> Tuple[int, bool]:
+        """Rough count at ~4 chars per token (OpenAI's rule of thumb for English).
 
-    def _count_approx(model: str, text: str) -> int:
-        return len(approx_enc.encode(text))
+        Deliberately skips BPE entirely: this path is only a labeled approximation, and
+        the lorem corpus is ASCII so chars == UTF-8 bytes.
+        """
+        return max(1, len(text) // 4), True
 
-    return _count_approx
+    yield _count_approx
 
 
 def summarize_counts(
@@ -198,12 +373,22 @@ def summarize_counts(
     counts: List[int],
     chars: int,
 ) -> SampleStats:
-    counts_sorted = sorted(counts)
-    mean_tokens = statistics.fmean(counts)
-    p50 = counts_sorted[len(counts_sorted) // 2]
-    p95_index = max(0, math.ceil(0.95 * len(counts_sorted)) - 1)
-    p95 = counts_sorted[p95_index]
-    stdev_tokens = statistics.pstdev(counts) if len(counts) > 1 else 0.0
+    p95_index = max(0, math.ceil(0.95 * len(counts)) - 1)
+    if np is not None:
+        # Selection instead of a full sort; only two order statistics are needed
+        arr = np.asarray(counts, dtype=np.int64)
+        mean_tokens = float(arr.mean())
+        stdev_tokens = float(arr.std()) if arr.size > 1 else 0.0
+        p50 = float(np.partition(arr, arr.size // 2)[arr.size // 2])
+        p95 = float(np.partition(arr, p95_index)[p95_index])
+    else:
+        counts_sorted = sorted(counts)
+        n = len(counts)
+        mean_tokens = math.fsum(counts) / n
+        ss = math.fsum((c - mean_tokens) * (c - mean_tokens) for c in counts)
+        stdev_tokens = math.sqrt(ss / n) if n > 1 else 0.0
+        p50 = counts_sorted[n // 2]
+        p95 = counts_sorted[p95_index]
     mean_per_1k_chars = mean_tokens / (chars / 1000.0)
     return SampleStats(
         size_label=size_label,
@@ -218,36 +403,148 @@ def summarize_counts(
     )
 
 
-def run_benchmark(
+def _encode_job(
+    size_label: str, models: List[str], texts: List[str], chars: int, num_threads: int
+) -> List[SampleStats]:
+    # --exact only. Runs in a worker process; each worker builds and memoizes its own
+    # encoders. All models in a job share one encoder, so the texts are encoded once.
+    enc = get_openai_encoder_for_model(models[0])
+    counts = count_tokens_batch(enc, texts, num_threads)
+    return [
+        summarize_counts(size_label, "openai", model, counts, chars) for model in models
+    ]
+
+
+async def run_benchmark(
     sizes: List[int],
     trials: int,
     openai_models: List[str],
     anthropic_models: List[str],
     seed: int,
     anthropic_api_key: Optional[str],
+    exact: bool = False,
 ) -> List[SampleStats]:
-    rng = random.Random(seed)
+    rng = make_rng(seed)
     results: List[SampleStats] = []
 
-    anthropic_counter = get_anthropic_counter(anthropic_api_key)
-
-    for chars in sizes:
-        size_label = f"{chars} chars"
-        # Pre-generate texts for consistent comparison across models per trial
-        texts = [generate_lorem_text_by_chars(chars, rng) for _ in range(trials)]
-
-        # OpenAI models
-        for model in openai_models:
-            counts = [count_tokens_openai(model, t) for t in texts]
-            results.append(summarize_counts(size_label, "openai", model, counts, chars))
+    # Anthropic rows are labeled by whether any of their counts was approximated (no
+    # live counts at all, or individual live calls that failed), so rows without the
+    # label are always measurements.
+    live_anthropic = _anthropic_live_key(anthropic_api_key) is not None
+    if anthropic_models and not live_anthropic:
+        print(
+            "No Anthropic SDK or API key; Anthropic rows are a ~4 chars/token "
+            f"approximation (provider '{ANTHROPIC_APPROX_PROVIDER}').",
+            file=sys.stderr,
+        )
 
-        # Anthropic models (tokenizer independent of model; counted for parity/reporting)
-        for model in anthropic_models:
-            counts = [anthropic_counter(model, t) for t in texts]
-            results.append(
-                summarize_counts(size_label, "anthropic", model, counts, chars)
+    live_fallbacks = 0
+
+    # Group models by encoder (e.g. gpt-4o, gpt-4o-mini and gpt-5 share o200k_base)
+    encoder_groups: Dict[str, List[str]] = {}
+    for model in openai_models:
+        enc = get_openai_encoder_for_model(model)
+        encoder_groups.setdefault(enc.name, []).append(model)
+
+    # The default per-word estimate is a cheap lookup done inline. With --exact, the
+    # CPU-bound tokenization fans (size, encoder) jobs out across processes.
+    # Anthropic counts are network-bound and run concurrently on the event loop.
+    # Per size: inline OpenAI rows, pending OpenAI jobs, then the Anthropic rows.
+    per_size: List[
+        Tuple[
+            List[SampleStats],
+            List["asyncio.Future[List[SampleStats]]"],
+            List[SampleStats],
+        ]
+    ] = []
+    # Split the cores between worker processes and tiktoken's per-batch threads so
+    # the two don't multiply into cpu_count**2 threads.
+    cpus = os.cpu_count() or 1
+    num_workers = max(1, min(cpus, len(sizes) * len(encoder_groups)))
+    num_threads = max(1, cpus // num_workers)
+    with contextlib.ExitStack() as stack:
+        procs = (
+            stack.enter_context(ProcessPoolExecutor(max_workers=num_workers))
+            if exact
+            else None
+        )
+        async with get_anthropic_counter(anthropic_api_key) as anthropic_counter:
+            for chars in sizes:
+                size_label = f"{chars} chars"
+                # Pre-generate texts for consistent comparison across models per trial
+                samples = [
+                    generate_lorem_text_by_chars(chars, rng) for _ in range(trials)
+                ]
+                texts = [text for text, _ in samples]
+
+                openai_rows: List[SampleStats] = []
+                openai_jobs: List["asyncio.Future[List[SampleStats]]"] = []
+                if procs is not None:
+                    openai_jobs = [
+                        asyncio.wrap_future(
+                            procs.submit(
+                                _encode_job,
+                                size_label,
+                                models,
+                                texts,
+                                chars,
+                                num_threads,
+                            )
+                        )
+                        for models in encoder_groups.values()
+                    ]
+                else:
+                    word_lists = [words for _, words in samples]
+                    for models in encoder_groups.values():
+                        enc = get_openai_encoder_for_model(models[0])
+                        counts = estimate_tokens_by_words(enc, word_lists)
+                        openai_rows.extend(
+                            summarize_counts(size_label, "openai", m, counts, chars)
+                            for m in models
+                        )
+
+                # Anthropic models (tokenizer independent of model; counted for
+                # parity/reporting). Every (model, text) call for this size at once,
+                # while the OpenAI jobs submitted so far keep the workers busy.
+                anthropic_counts = await asyncio.gather(
+                    *[
+                        anthropic_counter(model, t)
+                        for model in anthropic_models
+                        for t in texts
+                    ]
+                )
+                anthropic_rows: List[SampleStats] = []
+                for idx, model in enumerate(anthropic_models):
+                    row = anthropic_counts[idx * trials : (idx + 1) * trials]
+                    counts = [count for count, _ in row]
+                    row_fallbacks = sum(approx for _, approx in row)
+                    if live_anthropic:
+                        live_fallbacks += row_fallbacks
+                    provider = (
+                        ANTHROPIC_APPROX_PROVIDER if row_fallbacks else "anthropic"
+                    )
+                    anthropic_rows.append(
+                        summarize_counts(size_label, provider, model, counts, chars)
+                    )
+                per_size.append((openai_rows, openai_jobs, anthropic_rows))
+
+        if live_fallbacks:
+            total = len(sizes) * len(anthropic_models) * trials
+            print(
+                f"{live_fallbacks} of {total} Anthropic Count Tokens calls failed and "
+                "were approximated with cl100k_base; affected rows are labeled "
+                f"'{ANTHROPIC_APPROX_PROVIDER}'.",
+                file=sys.stderr,
             )
 
+        # Keep the output's size -> provider -> model ordering
+        for openai_rows, openai_jobs, anthropic_rows in per_size:
+            for rows in await asyncio.gather(*openai_jobs):
+                openai_rows.extend(rows)
+            by_model = {r.model: r for r in openai_rows}
+            results.extend(by_model[model] for model in openai_models)
+            results.extend(anthropic_rows)
+
     return results
 
 
@@ -265,29 +562,44 @@ def print_results_table(results: List[SampleStats]) -> None:
         "MeanTok/1kChars",
     )
     row_fmt = (
-        "{size:>10}  {provider:>9}  {model:<30}  {trials:>6}  "
+        "{size:>10}  {provider:>18}  {model:<30}  {trials:>6}  "
         "{mean:>10.1f}  {p50:>6.0f}  {p95:>6.0f}  {stdev:>7.1f}  {per1k:>14.1f}"
     )
-    print("\n" + " ".join(header))
-    print("-" * 108)
-    for r in results:
-        print(
-            row_fmt.format(
-                size=r.size_label,
-                provider=r.provider,
-                model=r.model,
-                trials=r.num_trials,
-                mean=r.mean_tokens,
-                p50=r.p50_tokens,
-                p95=r.p95_tokens,
-                stdev=r.stdev_tokens,
-                per1k=r.mean_tokens_per_1k_chars,
-            )
+    fmt = row_fmt.format
+    getter = attrgetter(
+        "size_label",
+        "provider",
+        "model",
+        "num_trials",
+        "mean_tokens",
+        "p50_tokens",
+        "p95_tokens",
+        "stdev_tokens",
+        "mean_tokens_per_1k_chars",
+    )
+    lines = ["", " ".join(header), "-" * 117]
+    lines.extend(
+        fmt(
+            size=size,
+            provider=provider,
+            model=model,
+            trials=trials,
+            mean=mean,
+            p50=p50,
+            p95=p95,
+            stdev=stdev,
+            per1k=per1k,
+        )
+        for size, provider, model, trials, mean, p50, p95, stdev, per1k in map(
+            getter, results
         )
+    )
+    # Single write instead of one print per row
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def write_results_csv(results: List[SampleStats], csv_path: str) -> None:
-    with open(csv_path, "w", newline="") as f:
+    with open(csv_path, "w", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(
             [
@@ -302,20 +614,20 @@ def write_results_csv(results: List[SampleStats], csv_path: str) -> None:
                 "mean_tokens_per_1k_chars",
             ]
         )
-        for r in results:
-            writer.writerow(
-                [
-                    r.size_label,
-                    r.provider,
-                    r.model,
-                    r.num_trials,
-                    f"{r.mean_tokens:.4f}",
-                    f"{r.p50_tokens:.4f}",
-                    f"{r.p95_tokens:.4f}",
-                    f"{r.stdev_tokens:.4f}",
-                    f"{r.mean_tokens_per_1k_chars:.4f}",
-                ]
+        writer.writerows(
+            (
+                r.size_label,
+                r.provider,
+                r.model,
+                r.num_trials,
+                f"{r.mean_tokens:.4f}",
+                f"{r.p50_tokens:.4f}",
+                f"{r.p95_tokens:.4f}",
+                f"{r.stdev_tokens:.4f}",
+                f"{r.mean_tokens_per_1k_chars:.4f}",
             )
+            for r in results
+        )
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -364,6 +676,14 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
             "If neither are set, falls back to approximation."
         ),
     )
+    parser.add_argument(
+        "--exact",
+        action="store_true",
+        help=(
+            "Run the OpenAI tokenizer over every text instead of summing precomputed "
+            "per-word token lengths."
+        ),
+    )
     parser.add_argument(
         "--csv",
         type=str,
@@ -375,13 +695,33 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
 
 def main(argv: Optional[List[str]] = None) -> int:
     args = parse_args(argv)
-    results = run_benchmark(
-        sizes=args.sizes,
-        trials=args.trials,
-        openai_models=args.openai_models,
-        anthropic_models=args.anthropic_models,
-        seed=args.seed,
-        anthropic_api_key=args.anthropic_api_key,
+    # Keep downloaded BPE files in a stable location so repeated runs skip the fetch.
+    # Respect either variable tiktoken reads; an empty value disables its cache.
+    if (
+        "TIKTOKEN_CACHE_DIR" not in os.environ
+        and "DATA_GYM_CACHE_DIR" not in os.environ
+    ):
+        os.environ["TIKTOKEN_CACHE_DIR"] = os.path.expanduser("~/.cache/tiktoken")
+    cache_dir = os.environ.get(
+        "TIKTOKEN_CACHE_DIR", os.environ.get("DATA_GYM_CACHE_DIR")
+    )
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    # Load encoders up front so their one-time cost stays out of the in-process
+    # estimate path; this also fills the on-disk BPE cache that --exact workers load
+    # their own encoders from.
+    for model in args.openai_models:
+        get_openai_encoder_for_model(model)
+    results = asyncio.run(
+        run_benchmark(
+            sizes=args.sizes,
+            trials=args.trials,
+            openai_models=args.openai_models,
+            anthropic_models=args.anthropic_models,
+            seed=args.seed,
+            anthropic_api_key=args.anthropic_api_key,
+            exact=args.exact,
+        )
     )
     print_results_table(results)
     if args.csv: